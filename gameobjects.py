@@ -1,5 +1,6 @@
 import json
 import random
+import sys
 import uuid
 
 
@@ -169,6 +170,8 @@ class Terrain(GameObject):
     Attributes:
         terrain_type (str): The specific type of the terrain (e.g., "forest", "mountain").
         elevation (int): The elevation level of the terrain.
+        terrain_condition (frozenset[str]): The condition tags of the terrain, if the
+                                            terrain type defines any.
         [dynamic attributes]: Attributes loaded dynamically from the "terrain.json" file
                               based on the provided `terrain_type`.
 
@@ -194,6 +197,15 @@ class Terrain(GameObject):
         for key, value in attributes.items():
             setattr(self, key, value)
 
+        # Conditions are stored as a set of tags, e.g. "river, bridgeable" becomes
+        # frozenset({"river", "bridgeable"}). The tags come from a small vocabulary,
+        # intern them so equal tags share one string object across all terrain objects
+        if hasattr(self, "terrain_condition"):
+            self.terrain_condition = frozenset(
+                sys.intern(condition.strip())
+                for condition in self.terrain_condition.split(",")
+            )
+
     def __str__(self):
         """
         Returns a detailed string representation of the terrain object.
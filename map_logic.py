@@ -4,6 +4,8 @@ import random
 import re
 from typing import Type
 
+import numpy as np
+
 from gameobjects import Terrain
 
 
@@ -318,6 +320,43 @@ class Hex:
 
         return Hex(int(string.split(",")[0]), int(string.split(",")[1]))
 
+    @classmethod
+    def hex_obj_from_pixel_coordinates(cls, x_axis, y_axis, size):
+        """
+        Returns the Hex object containing a pixel position.
+
+        This is the inverse of get_pixel_coordinates. The fractional axial coordinates
+        are rounded to the nearest hex in cube coordinates, so positions close to an
+        edge resolve to the correct side.
+
+        Args:
+            x_axis (float): The x pixel coordinate.
+            y_axis (float): The y pixel coordinate.
+            size (float): The distance from the center of a hexagon to any of its corners.
+
+        Returns:
+            Hex: The Hex object at the pixel position.
+        """
+        q_fraction = ((3**0.5) / 3 * x_axis - y_axis / 3) / size
+        r_fraction = (2 / 3 * y_axis) / size
+        s_fraction = -q_fraction - r_fraction
+
+        q_axis = round(q_fraction)
+        r_axis = round(r_fraction)
+        s_axis = round(s_fraction)
+
+        # Recalculate the coordinate with the largest rounding error from the others
+        q_diff = abs(q_axis - q_fraction)
+        r_diff = abs(r_axis - r_fraction)
+        s_diff = abs(s_axis - s_fraction)
+
+        if q_diff > r_diff and q_diff > s_diff:
+            q_axis = -r_axis - s_axis
+        elif r_diff > s_diff:
+            r_axis = -q_axis - s_axis
+
+        return cls(q_axis, r_axis)
+
 
 class Edge:
     """
@@ -493,6 +532,45 @@ class HexMap:
 
         return self.hex_map[hex_field]
 
+    def get_pixel_geometry(self, size):
+        """
+        Calculates the pixel centers, corners and edge centers of all hexagonal fields
+        at once.
+
+        The result matches get_pixel_coordinates, get_cornerpixel_coordinates and
+        get_edgecenter_pixel_coordinates of each Hex, but the trigonometry is only
+        evaluated for the six corner angles and the positions are computed as arrays
+        for the whole map.
+
+        Args:
+        - size: the distance from the center of a hexagon to any of its corners
+
+        Returns:
+        - a tuple of the hexagonal fields in map order, an array of shape (n, 2) with
+          their pixel centers, an array of shape (n, 6, 2) with their corners and an
+          array of shape (n, 6, 2) with their edge centers
+        """
+        hex_fields = tuple(self.hex_map)
+        axial = np.array(
+            [(hex_field.q_axis, hex_field.r_axis) for hex_field in hex_fields],
+            dtype=float,
+        ).reshape(-1, 2)
+
+        centers = np.empty_like(axial)
+        centers[:, 0] = size * (3**0.5) * (axial[:, 0] + axial[:, 1] / 2)
+        centers[:, 1] = size * 1.5 * axial[:, 1]
+
+        # Corner offsets from the center, starting from a vertical line
+        angles = np.deg2rad((60 * np.arange(6) - 90) % 360)
+        offsets = np.stack((np.cos(angles), np.sin(angles)), axis=1) * size
+
+        corners = centers[:, np.newaxis, :] + offsets
+
+        # Each edge center lies halfway between a corner and the next one
+        edge_centers = (corners + np.roll(corners, -1, axis=1)) / 2
+
+        return hex_fields, centers, corners, edge_centers
+
     def get_object_by_id(self, object_id):
         """
         Gets a game object by its ID.
@@ -1,8 +1,86 @@
-from typing import List, Tuple, Dict, Any
+import heapq
+import itertools
+import sys
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import List, Tuple, Dict, Mapping
+
+import numpy as np
 
 from gameobjects import Terrain, Structure
 from map_logic import Hex, HexMap, EdgeMap
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional, the CSR kernel then runs as plain Python
+    njit = None
+
+_BRIDGEABLE = sys.intern("bridgeable")
+
+
+class MovePath:
+    """
+    A single move from a hex field to one of its neighbours.
+
+    The class uses `__slots__`, so the many move paths of a map stay small and
+    their attributes are accessed by name instead of by tuple index.
+
+    Attributes:
+        source (Hex): The hex field the move starts from.
+        direction (int): The direction of the move (0-5).
+        target (Hex): The neighbouring hex field the move ends on.
+        movement_cost (int): The cost of the move.
+        movement_conditions (tuple[str]): Conditions needed for the move.
+    """
+
+    __slots__ = (
+        "source",
+        "direction",
+        "target",
+        "movement_cost",
+        "movement_conditions",
+    )
+
+    def __init__(
+        self,
+        source: Hex,
+        direction: int,
+        target: Hex,
+        movement_cost: int,
+        movement_conditions: Tuple[str, ...],
+    ) -> None:
+        self.source = source
+        self.direction = direction
+        self.target = target
+        self.movement_cost = movement_cost
+        self.movement_conditions = movement_conditions
+
+    def __str__(self):
+        """
+        Returns a string representation of the MovePath object.
+
+        Returns:
+            str: A string representation of the MovePath object.
+        """
+        return f"Move from {self.source} to {self.target} costing {self.movement_cost}"
+
+
+@dataclass
+class GraphData:
+    """
+    Container for the graph structures produced by `MoveCalculator.build_graph`.
+
+    Attributes:
+        nodes: All nodes (hex fields) present in the hex map.
+        neighbours: A dictionary with nodes as keys and their neighbouring nodes as values.
+        adjacency: A dictionary with nodes as keys and a list of their outgoing
+                   move paths as values.
+    """
+
+    nodes: Tuple[Hex, ...]
+    neighbours: Dict[Hex, Tuple[Hex, ...]]
+    adjacency: Dict[Hex, List[MovePath]]
+
 
 class MoveCalculator:
 
@@ -25,9 +103,12 @@ class MoveCalculator:
         self.hex_map = hex_map
         self.edge_map = edge_map
 
-    def get_neighbours(self, hex_field: Hex) -> List[Hex]:
+        # Shared condition tuples, so identical condition sets are only stored once
+        self._cond_pool: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+    def get_neighbours(self, hex_field: Hex) -> Tuple[Hex, ...]:
         """
-        Get a list of valid neighboring hexes for the given hex field.
+        Get a tuple of valid neighboring hexes for the given hex field.
 
         The method identifies and returns all neighboring hexes in valid directions
         from the provided hex field. A direction is considered valid if a neighboring
@@ -37,26 +118,27 @@ class MoveCalculator:
             hex_field (Hex): The hex field for which we want to find the neighbors.
 
         Returns:
-            list[Hex]: A list of Hex objects representing the neighboring hexes.
+            tuple[Hex]: A tuple of Hex objects representing the neighboring hexes.
 
         Example:
             >>> neighbours = obj.get_neighbours(some_hex_field)
             >>> print(neighbours)
-            [<Hex object at 0x...>, <Hex object at 0x...>, ...]
+            (<Hex object at 0x...>, <Hex object at 0x...>, ...)
 
         Notes:
             The method relies on other methods like `hex_map.hex_exists` and
             `Hex.get_neighbour_hex` to determine the neighboring hexes.
         """
 
-        neighbours = []
+        hex_exists = self.hex_map.hex_exists
 
-        for direction in range(6):
-            neighbour_hex = Hex.get_neighbour_hex(hex_field, direction)
-            if self.hex_map.hex_exists(neighbour_hex):
-                neighbours.append(neighbour_hex)
-
-        return neighbours
+        return tuple(
+            neighbour_hex
+            for neighbour_hex in (
+                Hex.get_neighbour_hex(hex_field, direction) for direction in range(6)
+            )
+            if hex_exists(neighbour_hex)
+        )
 
     def is_valid_direction(self, hex_field: Hex, direction: int) -> bool:
         """
@@ -72,9 +154,7 @@ class MoveCalculator:
         neighbour_hex = Hex.get_neighbour_hex(hex_field, direction)
         return self.hex_map.hex_exists(neighbour_hex)
 
-    def get_neighbour_conditions(
-        self, hex_field: Hex
-    ) -> List[Tuple[Hex, int, Hex, int, List[str]]]:
+    def get_neighbour_conditions(self, hex_field: Hex) -> List[MovePath]:
         """
         Get a list of valid conditions for neighboring hexes of the given hex field.
 
@@ -85,24 +165,24 @@ class MoveCalculator:
             hex_field (Hex): The hex field for which we want to find the neighbor conditions.
 
         Returns:
-            list[tuple]: A list of tuples, where each tuple contains:
-                - hex_field (Hex): The original hex field.
+            list[MovePath]: A list of move paths, where each move path contains:
+                - source (Hex): The original hex field.
                 - direction (int): The direction of the neighboring hex (0-5).
-                - move_target (Hex): The neighboring hex in the specified direction.
+                - target (Hex): The neighboring hex in the specified direction.
                 - movement_cost (int): The cost of moving to the neighboring hex.
-                - movement_conditions (list): List of conditions needed to move to the neighboring hex.
+                - movement_conditions (tuple): Conditions needed to move to the neighboring hex.
 
         Example:
             >>> conditions = obj.get_neighbour_conditions(some_hex_field)
-            >>> print(conditions)
-            [(<Hex object>, 0, <Hex object>, 5, ['condition1', 'condition2']), ...]
+            >>> print(conditions[0].target, conditions[0].movement_conditions)
+            Hex at coordinates q:1, r:-1 ('condition1', 'condition2')
 
         Notes:
             The method relies on other methods like `hex_map.hex_exists`, `get_movement_cost`,
             `get_movement_conditions`, and `Hex.get_neighbour_hex` to perform its operations.
         """
 
-        condition_list: List[Tuple[Hex, int, Hex, int, List[str]]] = []
+        condition_list: List[MovePath] = []
 
         for direction in range(6):
             if self.is_valid_direction(hex_field, direction):
@@ -110,7 +190,7 @@ class MoveCalculator:
                 movement_conditions = self.get_movement_conditions(hex_field, direction)
                 neighbour_hex = Hex.get_neighbour_hex(hex_field, direction)
                 condition_list.append(
-                    (
+                    MovePath(
                         hex_field,
                         direction,
                         neighbour_hex,
@@ -156,23 +236,24 @@ class MoveCalculator:
         hex_objects, edge_objects = self.neighbouring_hex_and_edge_objects(
             hex_field, direction
         )
+        game_objects = hex_objects + edge_objects
         summed_movement_cost = 0
 
         bridge = False
 
         # Check for bridge
 
-        for game_object in hex_objects + edge_objects:
+        for game_object in game_objects:
             if isinstance(game_object, Structure):
                 if hasattr(game_object, "structure_condition"):
                     if game_object.structure_condition == "bridge":
                         bridge = True
 
-        for game_object in hex_objects + edge_objects:
+        for game_object in game_objects:
             if isinstance(game_object, Terrain):
                 # Set move cost to 0 if bridge is present
                 if hasattr(game_object, "terrain_condition"):
-                    if "bridgeable" in game_object.terrain_condition and bridge == True:
+                    if _BRIDGEABLE in game_object.terrain_condition and bridge == True:
                         bridge = False
                         continue
 
@@ -195,14 +276,16 @@ class MoveCalculator:
 
         return summed_movement_cost
 
-    def get_movement_conditions(self, hex_field: Hex, direction: int) -> List[str]:
+    def get_movement_conditions(
+        self, hex_field: Hex, direction: int
+    ) -> Tuple[str, ...]:
         """
         Retrieve movement conditions for a given direction from a specified hex field.
 
         This method extracts the movement conditions from `Terrain` objects present
-        in the specified direction from the given hex field. It gathers conditions
-        from the terrain objects in both the target hex and any terrain objects on the edge
-        between the current and target hex.
+        in the specified direction from the given hex field. It gathers the condition
+        tags from the terrain objects in both the target hex and any terrain objects on
+        the edge between the current and target hex.
 
         Args:
             hex_field (Hex): The starting hex field from which we want to extract
@@ -210,8 +293,9 @@ class MoveCalculator:
             direction (int): The direction (0-5) in which we want to check the conditions.
 
         Returns:
-            list[str]: A list of movement conditions derived from the `Terrain` objects
-                       in the specified direction from the hex field.
+            tuple[str]: A tuple of movement conditions derived from the `Terrain` objects
+                        in the specified direction from the hex field. Equal tuples are
+                        shared between calls.
 
         Notes:
             - The method relies on the `neighbouring_hex_and_edge_objects` method
@@ -223,21 +307,22 @@ class MoveCalculator:
             >>> hex_instance = HexFieldClass()  # Assuming the class is named HexFieldClass
             >>> conditions = hex_instance.get_movement_conditions(some_hex_field, 2)
             >>> print(conditions)
-            ['condition1', 'condition2', ...]
+            ('condition1', 'condition2', ...)
         """
 
         hex_objects, edge_objects = self.neighbouring_hex_and_edge_objects(
             hex_field, direction
         )
 
-        conditions = [
-            game_object.terrain_condition
-            for game_object in hex_objects + edge_objects
+        conditions = tuple(
+            condition
+            for game_object in itertools.chain(hex_objects, edge_objects)
             if isinstance(game_object, Terrain)
             and hasattr(game_object, "terrain_condition")
-        ]
+            for condition in sorted(game_object.terrain_condition)
+        )
 
-        return conditions
+        return self._cond_pool.setdefault(conditions, conditions)
 
     def neighbouring_hex_and_edge_objects(
         self, hex_field: Hex, direction: int
@@ -286,48 +371,41 @@ class MoveCalculator:
 
         return hex_objects, edge_objects
 
-    def collect_neighbours_for_all(self) -> Dict[Hex, List[Hex]]:
+    def collect_neighbours_for_all(self) -> Dict[Hex, Tuple[Hex, ...]]:
         """
         Collect the neighbouring nodes for all nodes in the system.
 
         This method iterates through all nodes in the system and determines their
         respective neighbours. The results are returned as a dictionary where each key
-        is a node and its value is a list of its neighbouring nodes.
+        is a node and its value is a tuple of its neighbouring nodes.
 
         Returns:
             dict: A dictionary where each key is a node and the corresponding value
-                  is a list of its neighbouring nodes.
+                  is a tuple of its neighbouring nodes.
 
         Notes:
             - The method relies on other methods like `collect_all_nodes` and `get_neighbours`
               to perform its operations.
             - If a node doesn't have any neighbours, it will still be included in the returned
-              dictionary with an empty list as its value.
+              dictionary with an empty tuple as its value.
 
         Example:
             >>> neighbours = MoveCalculator_instance.collect_neighbours_for_all()
             >>> print(neighbours)
-            {<Node1>: [<Neighbour1>, <Neighbour2>, ...], <Node2>: [<Neighbour3>, ...], ...}
+            {<Node1>: (<Neighbour1>, <Neighbour2>, ...), <Node2>: (<Neighbour3>, ...), ...}
         """
 
-        all_nodes = self.collect_all_nodes()
-        neighbour_list = {}
+        return {node: self.get_neighbours(node) for node in self.collect_all_nodes()}
 
-        for node in all_nodes:
-            neighbours = self.get_neighbours(node)
-            neighbour_list.update({node: neighbours})
-
-        return neighbour_list
-
-    def collect_all_nodes(self) -> List[Hex]:
+    def collect_all_nodes(self) -> Tuple[Hex, ...]:
         """
         Collect all nodes (hex fields) present in the hex map.
 
         This method retrieves all the nodes, or hex fields, from the system's hex map
-        and returns them in a list.
+        and returns them in a tuple.
 
         Returns:
-            list: A list containing all nodes (hex fields) present in the system's hex map.
+            tuple: A tuple containing all nodes (hex fields) present in the system's hex map.
 
         Notes:
             - The method directly accesses the `hex_map` attribute of the system,
@@ -337,17 +415,12 @@ class MoveCalculator:
         Example:
             >>> all_nodes = MoveCalculator_instance.collect_all_nodes()
             >>> print(all_nodes)
-            [<HexField1>, <HexField2>, ...]
+            (<HexField1>, <HexField2>, ...)
         """
 
-        all_nodes = []
-
-        for hex_field in self.hex_map.hex_map.keys():
-            all_nodes.append(hex_field)
-
-        return all_nodes
+        return tuple(self.hex_map.hex_map)
 
-    def collect_move_paths(self) -> List[Tuple[Hex, int, Hex, int, List[str]]]:
+    def collect_move_paths(self) -> List[MovePath]:
         """
         Collect all possible movement paths from each node (hex field) in the system.
 
@@ -367,22 +440,123 @@ class MoveCalculator:
         Example:
             >>> system_instance = MoveCalculator()
             >>> move_paths = system_instance.collect_move_paths()
-            >>> print(move_paths)
-            [(<Node1>, <Direction1>, <TargetNode1>, ...), (<Node2>, <Direction2>, <TargetNode2>, ...), ...]
+            >>> print(move_paths[0])
+            Move from Hex at coordinates q:0, r:0 to Hex at coordinates q:1, r:-1 costing 2
         """
 
         all_move_paths = []
 
-        all_nodes = self.collect_all_nodes()
+        get_neighbour_conditions = self.get_neighbour_conditions
+        extend_move_paths = all_move_paths.extend
 
-        for node in all_nodes:
-            paths = self.get_neighbour_conditions(node)
-
-            for path in paths:
-                all_move_paths.append(path)
+        for node in self.collect_all_nodes():
+            extend_move_paths(get_neighbour_conditions(node))
 
         return all_move_paths
 
+    def build_graph(self) -> GraphData:
+        """
+        Collect nodes, neighbours and move paths for all hex fields in a single pass.
+
+        This method combines the work of `collect_all_nodes`, `collect_neighbours_for_all`
+        and `collect_move_paths`. Every hex field is visited once and its neighbours and
+        outgoing move paths are determined in the same loop over the six directions.
+
+        Returns:
+            GraphData: The nodes, the neighbours of every node and the outgoing move
+                       paths of every node, indexed by their source hex.
+
+        Notes:
+            - The move paths are grouped by the hex field they start from.
+
+        Example:
+            >>> graph_data = MoveCalculator_instance.build_graph()
+            >>> print(graph_data.adjacency[some_hex_field][0].movement_cost)
+            2
+        """
+
+        nodes = tuple(self.hex_map.hex_map)
+        neighbours: Dict[Hex, Tuple[Hex, ...]] = {}
+        adjacency: Dict[Hex, List[MovePath]] = {}
+
+        # Bind the lookups used in the loop to locals once
+        get_neighbour_hex = Hex.get_neighbour_hex
+        hex_exists = self.hex_map.hex_exists
+        get_movement_cost = self.get_movement_cost
+        get_movement_conditions = self.get_movement_conditions
+
+        for node in nodes:
+            node_neighbours = []
+            node_paths = []
+
+            for direction in range(6):
+                neighbour_hex = get_neighbour_hex(node, direction)
+                if not hex_exists(neighbour_hex):
+                    continue
+
+                node_neighbours.append(neighbour_hex)
+                node_paths.append(
+                    MovePath(
+                        node,
+                        direction,
+                        neighbour_hex,
+                        int(get_movement_cost(node, direction)),
+                        get_movement_conditions(node, direction),
+                    )
+                )
+
+            neighbours[node] = tuple(node_neighbours)
+            adjacency[node] = node_paths
+
+        return GraphData(nodes, neighbours, adjacency)
+
+
+def _csr_djikstra(adj_offsets, adj_targets, adj_costs, start_idx, move_cost_limit):
+    """
+    Run Dijkstra's shortest path algorithm on a graph stored in CSR layout.
+
+    The outgoing move paths of node `i` are stored at the positions
+    `adj_offsets[i]` to `adj_offsets[i + 1]` of `adj_targets` and `adj_costs`.
+    The function only works on integers and arrays, so it can be compiled with Numba.
+
+    Args:
+        adj_offsets: Start offset of the move paths of every node, followed by the
+                     total number of move paths.
+        adj_targets: Target node index of every move path.
+        adj_costs: Movement cost of every move path.
+        start_idx (int): Index of the node the search starts from.
+        move_cost_limit (int): The maximum movement cost allowed for a path to be considered.
+
+    Returns:
+        numpy.ndarray: The shortest distance to every node index,
+                       `move_cost_limit + 1` for nodes that can't be reached
+                       within `move_cost_limit`.
+    """
+    # Unreached nodes count as one more than the limit, like in `Graph.djikstra`
+    distances = np.full(len(adj_offsets) - 1, move_cost_limit + 1, np.int64)
+    distances[start_idx] = 0
+    queue = [(0, start_idx)]
+
+    while queue:
+        distance, node = heapq.heappop(queue)
+        if distance > distances[node]:
+            continue
+
+        for path in range(adj_offsets[node], adj_offsets[node + 1]):
+            target = np.int64(adj_targets[path])
+            new_distance = distance + adj_costs[path]
+
+            # Paths exceeding the limit are never queued
+            if new_distance < distances[target]:
+                distances[target] = new_distance
+                heapq.heappush(queue, (new_distance, target))
+
+    return distances
+
+
+if njit is not None:
+    _csr_djikstra = njit(cache=True)(_csr_djikstra)
+
 
 class Graph:
     def __init__(self, move_calculator: MoveCalculator) -> None:
@@ -395,41 +569,103 @@ class Graph:
         Args:
             move_calculator: An object that provides methods to collect move paths,
                              neighbours, and nodes for the graph. It should have
-                             the following methods:
-                             - collect_move_paths()
-                             - collect_neighbours_for_all()
-                             - collect_all_nodes()
+                             the following method:
+                             - build_graph()
 
         Attributes:
-            edges (list): A list of move paths collected from the move calculator.
+            adjacency (dict): A dictionary with nodes as keys and a list of their
+                              outgoing move paths as values.
             neighbours (dict): A dictionary with nodes as keys and their neighbours
                                as values, collected from the move calculator.
-            nodes (list): A list of all nodes collected from the move calculator.
+            nodes (tuple): A tuple of all nodes collected from the move calculator.
+            edges (list): A flat list of all move paths, derived from the adjacency.
+            hex_to_idx (dict): A dictionary mapping every node to its index in the
+                               CSR arrays.
+            idx_to_hex (list): A list mapping every CSR index back to its node.
+            adj_offsets (numpy.ndarray): Start offset of the move paths of every node
+                                         in `adj_targets` and `adj_costs`.
+            adj_targets (numpy.ndarray): Target node index of every move path.
+            adj_costs (numpy.ndarray): Movement cost of every move path.
 
         Notes:
-            - The initialization process also prints "Initializing graph" for
-              debugging or informational purposes.
+            - The CSR arrays are built by `compile_csr` during initialization.
+            - Results of `cached_djikstra` are kept until `clear_djikstra_cache`
+              is called, which has to happen whenever the map changes.
 
         Example:
             >>> move_calculator_instance = MoveCalculatorClass()  # Assuming MoveCalculatorClass is the name of the move calculator class
             >>> graph_instance = GraphClass(move_calculator_instance)  # Assuming the class is named GraphClass
             >>> print(graph_instance.nodes)
-            [<Node1>, <Node2>, ...]
+            (<Node1>, <Node2>, ...)
+        """
+        graph_data = move_calculator.build_graph()
+
+        self.nodes: Tuple[Hex, ...] = graph_data.nodes
+        self.neighbours: Dict[Hex, Tuple[Hex, ...]] = graph_data.neighbours
+        self.adjacency: Dict[Hex, List[MovePath]] = graph_data.adjacency
+
+        self.compile_csr()
+
+        self._dijkstra_cache: Dict[Tuple[Hex, int], Mapping[Hex, int]] = {}
+
+    def compile_csr(self) -> None:
         """
-        self.edges: List[
-            Tuple[Hex, int, Hex, int, List[str]]
-        ] = move_calculator.collect_move_paths()
-        self.neighbours: Dict[
-            Any, List[Any]
-        ] = move_calculator.collect_neighbours_for_all()
-        self.nodes: List[Any] = move_calculator.collect_all_nodes()
+        Encode the adjacency into contiguous arrays in CSR (compressed sparse row) layout.
+
+        Every node gets an integer index. The move paths of all nodes are stored one
+        after another in `adj_targets` and `adj_costs`, and `adj_offsets` marks where
+        the move paths of each node start. This is the representation used by
+        `djikstra_fast`.
+
+        Notes:
+            - The method has to be called again if the adjacency is changed.
+        """
+        self.idx_to_hex: List[Hex] = list(self.adjacency)
+        self.hex_to_idx: Dict[Hex, int] = {
+            node: index for index, node in enumerate(self.idx_to_hex)
+        }
+
+        self.adj_offsets = np.zeros(len(self.idx_to_hex) + 1, np.int32)
+        self.adj_offsets[1:] = np.cumsum(
+            [len(self.adjacency[node]) for node in self.idx_to_hex]
+        )
+        self.adj_targets = np.fromiter(
+            (
+                self.hex_to_idx[path.target]
+                for node in self.idx_to_hex
+                for path in self.adjacency[node]
+            ),
+            np.int32,
+            self.adj_offsets[-1],
+        )
+        self.adj_costs = np.fromiter(
+            (
+                path.movement_cost
+                for node in self.idx_to_hex
+                for path in self.adjacency[node]
+            ),
+            np.int32,
+            self.adj_offsets[-1],
+        )
+
+    @property
+    def edges(self) -> List[MovePath]:
+        """
+        A flat list of all move paths in the graph.
+
+        The move paths are in the format returned by `MoveCalculator.collect_move_paths`.
+
+        Returns:
+            list[MovePath]: All move paths, derived from the adjacency.
+        """
+        return [path for paths in self.adjacency.values() for path in paths]
 
     def get_movement_cost(self, node1: Hex, node2: Hex) -> int:
         """
         Retrieve the movement cost between two nodes.
 
-        This method searches through the graph's edges to find the movement cost
-        between the specified nodes, `node1` and `node2`.
+        This method searches through the move paths leaving `node1` to find the
+        movement cost between the specified nodes, `node1` and `node2`.
 
         Args:
             node1: The starting node.
@@ -440,10 +676,8 @@ class Graph:
                           is found between the nodes, the method raises a ValueError.
 
         Notes:
-            - The method assumes that edges are represented as a list of tuples where:
-                * The first item is the starting node.
-                * The third item is the ending node.
-                * The fourth item is the movement cost.
+            - The method looks up the outgoing move paths of `node1` in `adjacency`,
+              so only the (at most six) paths leaving `node1` are scanned.
             - Only the first matching edge found is considered.
 
         Example:
@@ -453,9 +687,9 @@ class Graph:
             5
         """
 
-        for item in self.edges:
-            if item[0] == node1 and item[2] == node2:
-                return int(item[3])
+        for path in self.adjacency.get(node1, ()):
+            if path.target == node2:
+                return path.movement_cost
 
         raise ValueError("No movement cost found between the two nodes")
 
@@ -472,17 +706,14 @@ class Graph:
             move_cost_limit (int): The maximum movement cost allowed for a path to be considered.
 
         Returns:
-            dict: A dictionary containing hex fields as keys and their shortest distances
-                  from the `start_hex` as values.
+            dict: A dictionary containing the hex fields reachable within `move_cost_limit`
+                  as keys and their shortest distances from the `start_hex` as values.
 
         Notes:
-            - The method relies on the `update_neighbour_distances` method to update the
-              distances of neighboring hex fields of the currently processed node.
-            - The `neighbours` attribute, expected to be a dictionary with hex fields
-              as keys and their neighbors as values, is used to determine the hex field
-              neighbors.
-            - The method assumes that if there's no path to a hex field, its distance
-              remains set to infinity.
+            - Hex fields are processed in order of their distance using a heap, and
+              the distances of their neighbors are updated from the `adjacency`.
+            - Paths exceeding `move_cost_limit` are discarded right away, so hex fields
+              that can't be reached within the limit are not part of the result.
 
         Example:
             >>> system_instance = Graph(move_calculator_instance)
@@ -490,66 +721,117 @@ class Graph:
             >>> print(distances)
             {<HexField1>: 5, <HexField2>: 10, ...}
         """
-        # Set all distances to infinity and start hex_field to 0
+        # Bind the lookups used in the loop to locals once
+        adjacency = self.adjacency
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+
+        # Only reached hex_fields get a distance. Unreached ones count as one more
+        # than the limit, so paths exceeding the limit are never queued.
 
-        distances: Dict[Hex, int] = {node: 10000 for node in self.neighbours.keys()}
-        distances[start_hex] = 0
+        distances: Dict[Hex, int] = {start_hex: 0}
+        distances_get = distances.get
+        unreached = move_cost_limit + 1
 
-        # Add all hex_fields to the unvisited set
+        # Queue entries are (distance, tie breaker, hex_field). The tie breaker keeps
+        # hex fields with equal distances from being compared to each other.
 
-        unvisited = set(self.neighbours.keys())
+        tie_breaker = itertools.count()
+        queue = [(0, next(tie_breaker), start_hex)]
 
-        # Iterate unvisited set until it is empty
-        while unvisited:
-            # Select the node with the smallest distance
-            current_node = min(unvisited, key=lambda node: distances[node])
-            if distances[current_node] > move_cost_limit:
-                break
-            distances = self.update_neighbour_distances(current_node, distances)
-            unvisited.remove(current_node)
+        # Process the closest hex_field until the queue is empty
+        while queue:
+            distance, _, current_node = heappop(queue)
+            if distance > distances[current_node]:
+                continue  # Outdated entry, the hex_field was already processed
+
+            for path in adjacency[current_node]:
+                neighbour = path.target
+                new_distance = distance + path.movement_cost
+
+                if new_distance < distances_get(neighbour, unreached):
+                    distances[neighbour] = new_distance
+                    heappush(queue, (new_distance, next(tie_breaker), neighbour))
 
         return distances
 
-    def update_neighbour_distances(
-        self, current_node: Hex, distances: Dict[Hex, int]
-    ) -> Dict[Hex, int]:
+    def cached_djikstra(
+        self, start_hex: Hex, move_cost_limit: int = 10000
+    ) -> Mapping[Hex, int]:
         """
-        Update the distances of neighboring nodes based on the current node's distance.
+        Return the result of `djikstra`, reusing earlier results for the same query.
 
-        Given a current node and its known shortest distances to other nodes, this method
-        updates the distances of its neighboring nodes by considering the movement cost
-        from the current node to each neighbor.
+        The distances only depend on the start hex field and the movement cost limit
+        as long as the map doesn't change, so they are cached per
+        (start_hex, move_cost_limit) pair.
 
         Args:
-            current_node: The node currently being processed.
-            distances (dict): A dictionary containing nodes as keys and their current shortest
-                              distances as values.
+            start_hex (Hex): The starting hex field from which shortest distances to all
+                             other hex fields are to be calculated.
+            move_cost_limit (int): The maximum movement cost allowed for a path to be considered.
 
         Returns:
-            dict: The updated distances dictionary with potentially shorter distances for
-                  the neighboring nodes of the current node.
-
-        Notes:
-            - The method utilizes the `get_movement_cost` function to determine the movement
-              cost between the current node and each of its neighbors.
-            - Only neighbors with a shorter new distance (compared to their current shortest
-              distance) are updated in the distances dictionary.
+            Mapping: A read-only mapping containing hex fields as keys and their shortest
+                     distances from the `start_hex` as values.
 
         Example:
-            >>> graph_instance = Graph(move_calculator_instance)
-            >>> distances = {nodeA: 0, nodeB: 5, nodeC: 10}
-            >>> updated_distances = graph_instance.update_neighbour_distances(nodeA, distances)
-            >>> print(updated_distances)
-            {nodeA: 0, nodeB: 3, nodeC: 8}
+            >>> system_instance = Graph(move_calculator_instance)
+            >>> distances = system_instance.cached_djikstra(some_start_hex, 6)
+            >>> print(distances[some_start_hex])
+            0
         """
+        key = (start_hex, move_cost_limit)
+        distances = self._dijkstra_cache.get(key)
 
-        for neighbour in self.neighbours[current_node]:
-            if neighbour in distances:
-                new_distance = distances[current_node] + self.get_movement_cost(
-                    current_node, neighbour
-                )
-
-                if new_distance < distances[neighbour]:
-                    distances[neighbour] = new_distance
+        if distances is None:
+            distances = MappingProxyType(self.djikstra(start_hex, move_cost_limit))
+            self._dijkstra_cache[key] = distances
 
         return distances
+
+    def clear_djikstra_cache(self) -> None:
+        """
+        Discard all results cached by `cached_djikstra`.
+
+        Has to be called whenever the map changes, as the cached distances would
+        otherwise be outdated.
+        """
+        self._dijkstra_cache.clear()
+
+    def djikstra_fast(self, start_hex: Hex, move_cost_limit: int = 10000):
+        """
+        Calculate the shortest distances from a given hex field on the CSR arrays.
+
+        This method returns the same result as `djikstra`, but runs the search on
+        the integer arrays built by `compile_csr`. If Numba is installed the search
+        is compiled to native code, otherwise it runs as plain Python with a heap.
+
+        Args:
+            start_hex (Hex): The starting hex field from which shortest distances to all
+                             other hex fields are to be calculated.
+            move_cost_limit (int): The maximum movement cost allowed for a path to be considered.
+
+        Returns:
+            dict: A dictionary containing the hex fields reachable within `move_cost_limit`
+                  as keys and their shortest distances from the `start_hex` as values.
+
+        Example:
+            >>> system_instance = Graph(move_calculator_instance)
+            >>> distances = system_instance.djikstra_fast(some_start_hex, 6)
+            >>> print(distances)
+            {<HexField1>: 5, <HexField2>: 10, ...}
+        """
+        distances = _csr_djikstra(
+            self.adj_offsets,
+            self.adj_targets,
+            self.adj_costs,
+            self.hex_to_idx[start_hex],
+            move_cost_limit,
+        )
+
+        reached = np.flatnonzero(distances <= move_cost_limit)
+
+        return {
+            self.idx_to_hex[index]: distance
+            for index, distance in zip(reached.tolist(), distances[reached].tolist())
+        }
@@ -1,11 +1,26 @@
-from PySide6.QtCore import Qt, QSize, QObject, Signal
-from PySide6.QtGui import QPen, QPainterPath, QPixmap, QColor, QFont
+from PySide6.QtCore import Qt, QPointF, QRectF, QSize, QObject, QTimer, Signal
+from PySide6.QtGui import (
+    QPen,
+    QPainter,
+    QPainterPath,
+    QPixmap,
+    QPixmapCache,
+    QPolygonF,
+    QColor,
+    QFont,
+    QOpenGLContext,
+    QSurfaceFormat,
+)
+from PySide6.QtOpenGLWidgets import QOpenGLWidget
 from PySide6.QtWidgets import (
     QGraphicsView,
     QGraphicsScene,
-    QGraphicsTextItem,
+    QGraphicsSimpleTextItem,
     QGraphicsPixmapItem,
     QGraphicsPathItem,
+    QGraphicsItem,
+    QGraphicsItemGroup,
+    QStyleOptionGraphicsItem,
     QWidget,
     QVBoxLayout,
     QLabel,
@@ -16,39 +31,93 @@ from PySide6.QtWidgets import (
 import gameobjects
 from map_logic import Hex
 
-PEN_COLOR_HOVER = "#979068"
-PEN_COLOR_DEFAULT = "#2b362b"
-
-
-class SignalEmitter(QObject):
-    hex_hovered = Signal(int, int)
-
-
-class HoverableHexagon(QGraphicsPathItem):
-    def __init__(self, path, hex):
-        super().__init__(path)
-        self.setAcceptHoverEvents(True)
-        self.hex = hex
-        self.emitter = SignalEmitter()
-
-    def hoverEnterEvent(self, event):
-        q_axis, r_axis = self.hex.get_axial_coordinates()
+# Colors are created once instead of parsing a color string on every use
+COLOR_HOVER = QColor(0x97, 0x90, 0x68)
+COLOR_DEFAULT = QColor(0x2B, 0x36, 0x2B)
+COLOR_LABEL = QColor(0x13, 0x0F, 0x06)
+COLOR_COORDINATE_LABEL = QColor(Qt.black)
+
+# Size of the hex fields, the distance from the center of a hex to its corners
+HEX_SIZE = 80
+
+# Pens shared by all hex outlines
+DEFAULT_PEN = QPen(COLOR_DEFAULT)
+DEFAULT_PEN.setWidth(5)
+HOVER_PEN = QPen(COLOR_HOVER)
+HOVER_PEN.setWidth(5)
+
+# Stacking order of the map layers, the hover outline is drawn above all of them
+Z_VALUE_BACKGROUND = -1
+Z_VALUE_HEX_OUTLINE = 0
+Z_VALUE_HEX_TEXTURE = 1
+Z_VALUE_COORDINATE_LABEL = 2
+Z_VALUE_EDGE_TEXTURE = 3
+Z_VALUE_DISTANCE_OVERLAY = 4
+Z_VALUE_HOVER_OUTLINE = 10
+
+# Space around the text of distance labels, in pixels
+LABEL_MARGIN = 4
+
+# Render the map through an OpenGL viewport if the platform supports it
+USE_OPENGL_VIEWPORT = True
+
+# Memory for cached scaled textures, in kilobytes
+PIXMAP_CACHE_LIMIT_KB = 65536
+
+# Edge textures by game object class and terrain type
+EDGE_ASSETS = {
+    (gameobjects.Terrain, "river"): "river.png",
+    (gameobjects.Structure, "road"): "road.png",
+    (gameobjects.Structure, "bridge"): "bridge.png",
+}
+
+# Delay before the move distances of a hovered hex are shown, in milliseconds
+HOVER_DELAY_MS = 40
+
+# Distance at which the distance color gradient reaches its final color
+DISTANCE_COLOR_MAX = 4
+
+
+def _compute_distance_color(distance, min_distance=0, max_distance=DISTANCE_COLOR_MAX):
+    """
+    Get a color based on the distance value using a gradient from green to red.
+
+    :param distance: Distance value
+    :param min_distance: Minimum expected distance (corresponds to green)
+    :param max_distance: Maximum expected distance (corresponds to red)
+    :return: QColor for the specified distance
+    """
+    # Normalize distance to a factor between 0 and 1
+
+    factor = (distance - min_distance) / (max_distance - min_distance)
+    factor = max(0, min(1, factor))  # Ensure factor is in [0, 1] range
+
+    # Determine the gradient segment and adjust the factor for the segment
+    if factor < 0.5:
+        start_color = (0x78, 0xA2, 0x6C)  # "#78a26c"
+        end_color = (0xFF, 0xCA, 0x51)  # "#ffca51"
+        factor = factor * 2  # Adjust factor for this segment
+    else:
+        start_color = (0xFF, 0xCA, 0x51)  # "#ffca51"
+        end_color = (0x83, 0x28, 0x00)  # "#832800"
+        factor = (factor - 0.5) * 2  # Adjust factor for this segment
+
+    return QColor.fromRgb(
+        *(
+            int(start + factor * (end - start))
+            for start, end in zip(start_color, end_color)
+        )
+    )
 
-        self.emitter.hex_hovered.emit(
-            q_axis, r_axis
-        )  # Emit the signal to the parent widget
 
-        pen = QPen(QColor(PEN_COLOR_HOVER))
-        pen.setWidth(5)
+# Gradient colors indexed by distance, larger distances use the last color
+DISTANCE_COLOR_LUT = tuple(
+    _compute_distance_color(distance) for distance in range(DISTANCE_COLOR_MAX + 1)
+)
 
-        self.setPen(pen)
-        self.setZValue(10)
 
-    def hoverLeaveEvent(self, event):
-        pen = QPen(QColor(PEN_COLOR_DEFAULT))  # Original color
-        pen.setWidth(5)
-        self.setPen(pen)
-        self.setZValue(0)
+class SignalEmitter(QObject):
+    hex_hovered = Signal(int, int)
 
 
 class HexMapVisualization(QGraphicsView):
@@ -58,109 +127,243 @@ class HexMapVisualization(QGraphicsView):
         self.hex_map = hex_map
         self.edge_map = edge_map
         self.graph = graph
+        QPixmapCache.setCacheLimit(PIXMAP_CACHE_LIMIT_KB)
+        self.setup_viewport()
+        # Thousands of outlines are cheaper to rasterize without antialiasing
+        self.setRenderHint(QPainter.Antialiasing, False)
+        self.setRenderHint(QPainter.SmoothPixmapTransform, False)
         self.scene = QGraphicsScene(self)
         self.setScene(self.scene)
+        self._item_groups = {}
+        # Pixmap item holding the rendered static layers, and the items drawn on top
+        self._background_item = None
+        self._distance_group = None
+        self._hover_outline = None
+        # Rendered distance label texts, keyed by text
+        self._label_pixmaps = {}
+        # Hex under the cursor, picked from the mouse position
+        self._hovered_hex = None
+        self.viewport().setMouseTracking(True)
+        self.emitter = SignalEmitter(self)
+        self.emitter.hex_hovered.connect(self.update_info_label)
+        self.emitter.hex_hovered.connect(self.queue_move_distances)
+        # Coalesces hovers while the cursor moves across several hexes
+        self._pending_hex = None
+        self._hover_timer = QTimer(self)
+        self._hover_timer.setSingleShot(True)
+        self._hover_timer.setInterval(HOVER_DELAY_MS)
+        self._hover_timer.timeout.connect(self.show_pending_move_distances)
+        # Hex outlines centered on the origin, keyed by hex size
+        self._hex_paths = {}
+        # Font shared by all labels of the map
+        self._label_font = QFont("Vinque Rg", 15)
+        # Distances of the hovered hex and the labels created for them, keyed by Hex
+        self._shown_distances = {}
+        self._distance_items: dict[
+            Hex, tuple[QGraphicsPathItem, QGraphicsPixmapItem]
+        ] = {}
+        # Hexes whose distance label is currently shown
+        self._active_distance_hexes: set[Hex] = set()
         self.draw_map()
 
-    @staticmethod
-    def interpolate_color(min_color, max_color, factor):
+    def setup_viewport(self):
         """
-        Interpolate between two QColor objects based on a factor.
+        Render the view through OpenGL when the platform provides it.
 
-        :param min_color: Starting QColor
-        :param max_color: Ending QColor
-        :param factor: Value between 0 and 1 to interpolate colors
-        :return: Interpolated QColor
+        Pixmap and path drawing then happens on the GPU. Without an OpenGL context,
+        e.g. on the offscreen platform, the default raster viewport is kept.
         """
-        red = min_color.red() + factor * (max_color.red() - min_color.red())
-        green = min_color.green() + factor * (max_color.green() - min_color.green())
-        blue = min_color.blue() + factor * (max_color.blue() - min_color.blue())
-        return QColor(red, green, blue)
+        if not USE_OPENGL_VIEWPORT or not QOpenGLContext().create():
+            return
 
-    def get_color_for_distance(self, distance, min_distance=0, max_distance=4):
-        """
-        Get a color based on the distance value using a gradient from green to red.
+        surface_format = QSurfaceFormat()
+        surface_format.setSamples(0)
 
-        :param distance: Distance value
-        :param min_distance: Minimum expected distance (corresponds to green)
-        :param max_distance: Maximum expected distance (corresponds to red)
-        :return: QColor for the specified distance
+        opengl_viewport = QOpenGLWidget()
+        opengl_viewport.setFormat(surface_format)
+
+        self.setViewport(opengl_viewport)
+        # OpenGL viewports always repaint completely
+        self.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+
+    def _get_item_group(self, key, z_value):
         """
-        # Normalize distance to a factor between 0 and 1
+        Get the item group for a layer of static items, creating it on first use.
 
-        factor = (distance - min_distance) / (max_distance - min_distance)
-        factor = max(0, min(1, factor))  # Ensure factor is in [0, 1] range
+        Items sharing a texture are collected in one group, so the scene handles them
+        as a single item instead of one item per hex.
 
-        # Determine the gradient segment and adjust the factor for the segment
-        if factor < 0.5:
-            start_color = QColor("#78a26c")
-            end_color = QColor("#ffca51")
-            factor = factor * 2  # Adjust factor for this segment
-        else:
-            start_color = QColor("#ffca51")
-            end_color = QColor("#832800")
-            factor = (factor - 0.5) * 2  # Adjust factor for this segment
+        :param key: Key identifying the group, e.g. the layer and texture name
+        :param z_value: Z value of the group in the scene
+        :return: QGraphicsItemGroup for the key
+        """
+        group = self._item_groups.get(key)
 
-        return self.interpolate_color(start_color, end_color, factor)
+        if group is None:
+            group = QGraphicsItemGroup()
+            group.setZValue(z_value)
+            self.scene.addItem(group)
+            self._item_groups[key] = group
+
+        return group
 
     def draw_map(self):
-        hex_size = 80
+        hex_size = HEX_SIZE
+
+        # Adding thousands of items to an indexed scene rebuilds the BSP tree on
+        # every insert. Hovered hexes are picked from the mouse position, so the
+        # scene never needs an index
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
+        self.setUpdatesEnabled(False)
+
+        self.draw_static_layers(hex_size)
+        self.cache_static_layers()
+
+        # Distance labels are created on demand for the hexes in view. The group is
+        # kept apart from the static layers, so it survives rendering them again
+        self._distance_group = QGraphicsItemGroup()
+        self._distance_group.setZValue(Z_VALUE_DISTANCE_OVERLAY)
+        self.scene.addItem(self._distance_group)
+
+        # A single outline follows the hovered hex
+        self._hover_outline = QGraphicsPathItem(self._get_hex_path(hex_size))
+        self._hover_outline.setPen(HOVER_PEN)
+        self._hover_outline.setZValue(Z_VALUE_HOVER_OUTLINE)
+        self._hover_outline.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+        self._hover_outline.setVisible(False)
+        self.scene.addItem(self._hover_outline)
+
+        self.setUpdatesEnabled(True)
+
+    def draw_static_layers(self, hex_size):
+        """
+        Add the hex outlines, terrain textures, coordinate labels and edge textures
+        of the whole map to their item groups.
+
+        :param hex_size: Size of the hex fields
+        """
+        # Calculate the centers and edge centers of all hexes in one go
+        geometry = self.hex_map.get_pixel_geometry(hex_size)
+        hex_fields, hex_centers, _, edge_center_array = geometry
+
+        # The geometry follows the order of the hex map
+        for hex_field, center, game_objects in zip(
+            hex_fields, hex_centers.tolist(), self.hex_map.hex_map.values()
+        ):
+            self.draw_hex_terrain(hex_field, hex_size, center, game_objects)
 
-        for hex_field, game_objects in self.hex_map.hex_map.items():
-            self.draw_hex_terrain(hex_field, hex_size)
+        # Edge centers of each spawn hex, shared by the up to three edges it spawns
+        hex_edge_centers = dict(zip(hex_fields, edge_center_array.tolist()))
 
         for edge, game_objects in self.edge_map.edge_map.items():
-            # check if the game object is a river and a terrain
+            # Draw rivers, roads and bridges, other edge objects have no texture
             for game_object in game_objects:
-                if (
-                    isinstance(game_object, gameobjects.Terrain)
-                    and game_object.terrain_type == "river"
-                ):
-                    self.add_graphic_to_edge(edge, hex_size, "river.png")
-                elif (
-                    isinstance(game_object, gameobjects.Structure)
-                    and game_object.terrain_type == "road"
-                ):
-                    self.add_graphic_to_edge(edge, hex_size, "road.png")
-                elif (
-                    isinstance(game_object, gameobjects.Structure)
-                    and game_object.terrain_type == "bridge"
-                ):
-                    self.add_graphic_to_edge(edge, hex_size, "bridge.png")
-
-    def draw_hex_terrain(self, hex, size):
-        # Define hex corners
-
-        corners = hex.get_cornerpixel_coordinates(size)
-
-        # Create a path for the hex shape
-
-        hex_path = QPainterPath()
-        hex_path.moveTo(*corners[0])
-        for corner in corners[1:]:
-            hex_path.lineTo(*corner)
-        hex_path.closeSubpath()
-
-        pen = QPen(QColor("#2b362b"))
-        pen.setWidth(5)
-
-        hoverable_hex = HoverableHexagon(hex_path, hex)
-        hoverable_hex.emitter.hex_hovered.connect(self.update_info_label)
-        hoverable_hex.emitter.hex_hovered.connect(self.show_move_distances)
-        hoverable_hex.setPen(pen)
-
-        self.scene.addItem(hoverable_hex)
-
-        for game_object in self.hex_map.get_hex_object_list(hex):
-            if isinstance(game_object, gameobjects.Terrain):
-                self.add_graphic_to_hex(hex, size, game_object.texture)
-                self.add_coordinate_labels(hex, size)
-
-    def add_coordinate_labels(self, hex, size):
-        hex_x_coordinates, hex_y_coordinates = hex.get_pixel_coordinates(size)
-
-        label = QGraphicsTextItem(f"{hex.q_axis}, {hex.r_axis}")
-        label.setFont(QFont("Vinque Rg", 15))
+                asset = EDGE_ASSETS.get(
+                    (type(game_object), getattr(game_object, "terrain_type", None))
+                )
+                if asset is None:
+                    continue
+
+                edge_centers = hex_edge_centers.get(edge.spawn_hex)
+                if edge_centers is None:
+                    edge_centers = edge.spawn_hex.get_edgecenter_pixel_coordinates(
+                        hex_size
+                    )
+                    hex_edge_centers[edge.spawn_hex] = edge_centers
+
+                self.add_graphic_to_edge(edge, hex_size, asset, edge_centers)
+
+    def cache_static_layers(self):
+        """
+        Render the static map layers into a single background pixmap.
+
+        Hex outlines, terrain textures, coordinate labels and edge textures do not
+        change after the map is drawn, so they are painted once with the current
+        render hints and replaced by one pixmap item. The groups filled by
+        `draw_static_layers` are removed afterwards, a previous background is
+        replaced.
+        """
+        if self._background_item is not None:
+            self.scene.removeItem(self._background_item)
+            self._background_item = None
+
+        source_rect = QRectF()
+        for group in self._item_groups.values():
+            source_rect = source_rect.united(group.sceneBoundingRect())
+        source_rect = source_rect.toAlignedRect()
+
+        # Only the static layers are painted, the live items are hidden meanwhile
+        live_items = [
+            item
+            for item in (self._distance_group, self._hover_outline)
+            if item is not None and item.isVisible()
+        ]
+        for item in live_items:
+            item.setVisible(False)
+
+        background = QPixmap(source_rect.size())
+        background.fill(Qt.transparent)
+
+        painter = QPainter(background)
+        painter.setRenderHints(self.renderHints())
+        self.scene.render(painter, background.rect(), source_rect)
+        painter.end()
+
+        for item in live_items:
+            item.setVisible(True)
+
+        for group in self._item_groups.values():
+            self.scene.removeItem(group)
+        self._item_groups.clear()
+
+        self._background_item = QGraphicsPixmapItem(background)
+        self._background_item.setTransformationMode(Qt.SmoothTransformation)
+        self._background_item.setPos(source_rect.topLeft())
+        self._background_item.setZValue(Z_VALUE_BACKGROUND)
+        self.scene.addItem(self._background_item)
+
+    def draw_hex_terrain(self, hex, size, center=None, game_objects=None):
+        # Place the shared hex shape on the hex center, unless it was precalculated
+        # for the whole map
+
+        if center is None:
+            center = hex.get_pixel_coordinates(size)
+
+        hex_outline = QGraphicsPathItem(self._get_hex_path(size))
+        hex_outline.setPos(*center)
+        hex_outline.setPen(DEFAULT_PEN)
+
+        self._get_item_group("outlines", Z_VALUE_HEX_OUTLINE).addToGroup(hex_outline)
+
+        if game_objects is None:
+            game_objects = self.hex_map.get_hex_object_list(hex)
+
+        # A hex holds at most one terrain, most hexes hold nothing else
+        if len(game_objects) == 1:
+            terrain = game_objects[0]
+        else:
+            terrain = next(
+                (
+                    game_object
+                    for game_object in game_objects
+                    if isinstance(game_object, gameobjects.Terrain)
+                ),
+                None,
+            )
+
+        if isinstance(terrain, gameobjects.Terrain):
+            self.add_graphic_to_hex(hex, size, terrain.texture, center)
+            self.add_coordinate_labels(hex, size, center)
+
+    def add_coordinate_labels(self, hex, size, center=None):
+        if center is None:
+            center = hex.get_pixel_coordinates(size)
+
+        hex_x_coordinates, hex_y_coordinates = center
+
+        label = QGraphicsSimpleTextItem(f"{hex.q_axis}, {hex.r_axis}")
+        label.setFont(self._label_font)
+        label.setBrush(COLOR_COORDINATE_LABEL)
         label.setOpacity(0.6)
 
         label.setPos(
@@ -168,66 +371,273 @@ class HexMapVisualization(QGraphicsView):
             hex_y_coordinates - label.boundingRect().height() / 2,
         )
 
-        self.scene.addItem(label)
+        self._get_item_group("labels", Z_VALUE_COORDINATE_LABEL).addToGroup(label)
 
-    def show_move_distances(self, q=0, r=0, move_cost_limit=6):
-        hex_size = 80
+    def mouseMoveEvent(self, event):
+        super().mouseMoveEvent(event)
+        hex_size = HEX_SIZE
+
+        scene_position = self.mapToScene(event.position().toPoint())
+        hex_field = Hex.hex_obj_from_pixel_coordinates(
+            scene_position.x(), scene_position.y(), hex_size
+        )
+
+        if not self.hex_map.hex_exists(hex_field):
+            hex_field = None
+
+        self.set_hovered_hex(hex_field, hex_size)
+
+    def leaveEvent(self, event):
+        super().leaveEvent(event)
+        self.set_hovered_hex(None)
+
+    def set_hovered_hex(self, hex_field, hex_size=HEX_SIZE):
+        """
+        Move the hover outline to a hex and announce it, if it changed.
+
+        :param hex_field: Hex under the cursor, None if the cursor is not on the map
+        :param hex_size: Size of the hex fields
+        """
+        if hex_field == self._hovered_hex:
+            return
+
+        self._hovered_hex = hex_field
 
-        distances = self.graph.djikstra(
+        if hex_field is None:
+            self._hover_outline.setVisible(False)
+            return
+
+        self._hover_outline.setPos(*hex_field.get_pixel_coordinates(hex_size))
+        self._hover_outline.setVisible(True)
+
+        q_axis, r_axis = hex_field.get_axial_coordinates()
+        self.emitter.hex_hovered.emit(q_axis, r_axis)
+
+    def queue_move_distances(self, q, r):
+        """
+        Show the move distances of a hovered hex once the cursor rests on it.
+
+        Each hover restarts the timer, so only the last hex hovered within the delay
+        is calculated and drawn.
+
+        :param q: q axis of the hovered hex
+        :param r: r axis of the hovered hex
+        """
+        self._pending_hex = (q, r)
+        self._hover_timer.start()
+
+    def show_pending_move_distances(self):
+        if self._pending_hex is not None:
+            self.show_move_distances(*self._pending_hex)
+            self._pending_hex = None
+
+    def show_move_distances(self, q=0, r=0, move_cost_limit=6):
+        self._shown_distances = self.graph.cached_djikstra(
             Hex.hex_obj_from_string(f"{q},{r}"), move_cost_limit
         )
+        self.update_distance_items()
+
+    def update_distance_items(self, hex_size=HEX_SIZE):
+        """
+        Show the distance labels of the hex fields within reach that are in view.
+
+        Labels are only created once their hex field is scrolled into view, labels
+        of hex fields out of reach are hidden and kept for later hovers.
+
+        :param hex_size: Size of the hex fields
+        """
+        distances = self._shown_distances
+        visible_rect = self.mapToScene(self.viewport().rect()).boundingRect()
+
+        # Hide the shown labels of hex fields no longer within reach
+        for hex_field in self._active_distance_hexes.difference(distances):
+            for item in self._distance_items[hex_field]:
+                item.setVisible(False)
+        self._active_distance_hexes.intersection_update(distances)
 
-        # Remove all distance labels from the scene
-        for item in self.scene.items():
-            if getattr(item, "is_distance_label", False):
-                self.scene.removeItem(item)
+        for hex_field, distance in distances.items():
+            distance_items = self._distance_items.get(hex_field)
 
-        # Iterate over the Hex Fields and add the distance labels
-        for hex_field in self.hex_map.hex_map.keys():
-            if not distances[hex_field] > move_cost_limit:
+            if distance_items is None:
                 hex_x_coordinates, hex_y_coordinates = hex_field.get_pixel_coordinates(
                     hex_size
                 )
+                hex_rect = QRectF(
+                    hex_x_coordinates - hex_size,
+                    hex_y_coordinates - hex_size,
+                    2 * hex_size,
+                    2 * hex_size,
+                )
+
+                if not visible_rect.intersects(hex_rect):
+                    continue
+
+                distance_items = self._create_distance_items(hex_field, distance)
+                for item in distance_items:
+                    self._distance_group.addToGroup(item)
+                self._distance_items[hex_field] = distance_items
+                self._active_distance_hexes.add(hex_field)
+                continue
+
+            circle_item, label_distances = distance_items
+            circle_item.setVisible(True)
+            label_distances.setVisible(True)
+            self._active_distance_hexes.add(hex_field)
+
+            pixmap = self._get_label_pixmap(f"{distance}")
 
-                label_distances = QGraphicsTextItem(f"{distances[hex_field]}")
-                label_distances.setFont(QFont("Vinque Rg", 15))
-                label_distances.setPos(
-                    hex_x_coordinates - label_distances.boundingRect().width() / 2,
-                    hex_y_coordinates - label_distances.boundingRect().height() + 60,
+            if label_distances.pixmap().cacheKey() != pixmap.cacheKey():
+                label_distances.setPixmap(pixmap)
+                self._place_distance_items(hex_field, circle_item, label_distances)
+                circle_item.setBrush(
+                    DISTANCE_COLOR_LUT[min(distance, DISTANCE_COLOR_MAX)]
                 )
-                label_distances.setOpacity(1)
 
-                color = self.get_color_for_distance(distances[hex_field])
-                label_distances.setDefaultTextColor("#130f06")
+    def scrollContentsBy(self, dx, dy):
+        super().scrollContentsBy(dx, dy)
+        # Create the labels of hex fields within reach scrolled into view
+        self.update_distance_items()
 
-                # Draw a small circle below the label
-                circle_path = QPainterPath()
-                circle_path.addEllipse(label_distances.boundingRect().center(), 13, 13)
-                circle_item = QGraphicsPathItem(circle_path)
-                circle_item.setBrush(QColor(color))
-                circle_item.setOpacity(0.6)
-                circle_item.setPen(Qt.NoPen)
-                circle_item.setPos(label_distances.pos())
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.update_distance_items()
 
-                # Flag items as distance labels
-                circle_item.is_distance_label = True
-                label_distances.is_distance_label = True
+    def _create_distance_items(self, hex_field, distance):
+        """
+        Create the distance label and the circle below it for a hex field.
+
+        :param hex_field: Hex the label belongs to
+        :param distance: Distance shown on the label
+        :return: Tuple of the circle item and the label item
+        """
+        label_distances = QGraphicsPixmapItem(self._get_label_pixmap(f"{distance}"))
+        label_distances.setOpacity(1)
+        label_distances.setTransformationMode(Qt.SmoothTransformation)
 
-                self.scene.addItem(circle_item)
-                self.scene.addItem(label_distances)
+        # Draw a small circle below the label
+        circle_path = QPainterPath()
+        circle_path.addEllipse(label_distances.boundingRect().center(), 13, 13)
+        circle_item = QGraphicsPathItem(circle_path)
+        circle_item.setBrush(DISTANCE_COLOR_LUT[min(distance, DISTANCE_COLOR_MAX)])
+        circle_item.setOpacity(0.6)
+        circle_item.setPen(Qt.NoPen)
+        circle_item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
 
-    def add_graphic_to_hex(self, hex_field, size, asset="missing.png"):
-        x_axis, y_axis = hex_field.get_pixel_coordinates(size)
+        self._place_distance_items(hex_field, circle_item, label_distances)
 
-        # Create a scaled QPixmap object
+        return circle_item, label_distances
 
-        scale_factor = 2.33
-        pixmap = QPixmap(f"assets/{asset}")
-        scale_pixmap = pixmap.scaled(
-            QSize(size * scale_factor, size * scale_factor),
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation,
+    def _get_label_pixmap(self, text):
+        """
+        Get the pre-rendered pixmap of a distance label, rendering it on first use.
+
+        Distance labels only show a handful of different numbers, so each text is
+        laid out once and shared by all labels showing it.
+
+        :param text: Text of the label
+        :return: QPixmap with the rendered text
+        """
+        pixmap = self._label_pixmaps.get(text)
+
+        if pixmap is None:
+            text_item = QGraphicsSimpleTextItem(text)
+            text_item.setFont(self._label_font)
+            text_item.setBrush(COLOR_LABEL)
+
+            # Keep the margin of the former text document around the text, the
+            # labels are positioned relative to the pixmap size
+            margin = LABEL_MARGIN
+            text_size = text_item.boundingRect().size().toSize()
+            pixmap = QPixmap(text_size + QSize(2 * margin, 2 * margin))
+            pixmap.fill(Qt.transparent)
+
+            painter = QPainter(pixmap)
+            painter.setRenderHints(self.renderHints())
+            painter.translate(margin, margin)
+            text_item.paint(painter, QStyleOptionGraphicsItem(), None)
+            painter.end()
+
+            self._label_pixmaps[text] = pixmap
+
+        return pixmap
+
+    @staticmethod
+    def _place_distance_items(
+        hex_field, circle_item, label_distances, hex_size=HEX_SIZE
+    ):
+        """
+        Center a distance label and its circle in the lower part of a hex field.
+
+        :param hex_field: Hex the label belongs to
+        :param circle_item: Circle drawn below the label
+        :param label_distances: Label showing the distance
+        :param hex_size: Size of the hex fields
+        """
+        hex_x_coordinates, hex_y_coordinates = hex_field.get_pixel_coordinates(hex_size)
+
+        label_distances.setPos(
+            hex_x_coordinates - label_distances.boundingRect().width() / 2,
+            hex_y_coordinates - label_distances.boundingRect().height() + 60,
         )
+        circle_item.setPos(label_distances.pos())
+
+    def _get_hex_path(self, size):
+        """
+        Get the outline of a hex centered on the origin, creating it on first use.
+
+        All hexes share this path and are moved to their position with setPos.
+
+        :param size: Size of the hex
+        :return: QPainterPath of the hex shape
+        """
+        hex_path = self._hex_paths.get(size)
+
+        if hex_path is None:
+            corners = Hex(0, 0).get_cornerpixel_coordinates(size)
+
+            hex_path = QPainterPath()
+            hex_path.addPolygon(QPolygonF([QPointF(*corner) for corner in corners]))
+            hex_path.closeSubpath()
+            self._hex_paths[size] = hex_path
+
+        return hex_path
+
+    def _get_scaled_pixmap(self, asset, size, scale_factor):
+        """
+        Load a texture from the assets folder scaled to the given size.
+
+        Scaled textures are kept in the QPixmapCache, so each texture is loaded and
+        scaled once and shared by all hexes and edges while Qt bounds the memory.
+
+        :param asset: File name of the texture in the assets folder
+        :param size: Size of the hex the texture is drawn on
+        :param scale_factor: Factor the texture is scaled by relative to the hex size
+        :return: Scaled QPixmap
+        """
+        key = f"{asset}@{size}x{scale_factor}"
+        scale_pixmap = QPixmap()
+
+        if not QPixmapCache.find(key, scale_pixmap):
+            pixmap = QPixmap(f"assets/{asset}")
+            scale_pixmap = pixmap.scaled(
+                QSize(size * scale_factor, size * scale_factor),
+                Qt.KeepAspectRatio,
+                Qt.SmoothTransformation,
+            )
+            QPixmapCache.insert(key, scale_pixmap)
+
+        return scale_pixmap
+
+    def add_graphic_to_hex(self, hex_field, size, asset="missing.png", center=None):
+        if center is None:
+            center = hex_field.get_pixel_coordinates(size)
+
+        x_axis, y_axis = center
+
+        # Get the scaled QPixmap object
+
+        scale_factor = 2.33
+        scale_pixmap = self._get_scaled_pixmap(asset, size, scale_factor)
 
         # Create a QGraphicsPixmapItem and set its pixmap
 
@@ -242,15 +652,20 @@ class HexMapVisualization(QGraphicsView):
 
         pixmap_item.setPos(graphic_x_center, graphic_y_center)
 
-        # Draw the hex
+        # Draw the hex, grouped with all hexes using the same texture
 
-        self.scene.addItem(pixmap_item)
+        self._get_item_group(("hex", asset), Z_VALUE_HEX_TEXTURE).addToGroup(
+            pixmap_item
+        )
 
-    def add_graphic_to_edge(self, edge, size, asset="missing.png"):
+    def add_graphic_to_edge(
+        self, edge, size, asset="missing.png", edge_center_coordinates=None
+    ):
         rotation_matrix = (-60, 0, 60, -60, 0, 60)
 
-        source_hex = edge.spawn_hex
-        edge_center_coordinates = source_hex.get_edgecenter_pixel_coordinates(size)
+        if edge_center_coordinates is None:
+            source_hex = edge.spawn_hex
+            edge_center_coordinates = source_hex.get_edgecenter_pixel_coordinates(size)
 
         x_axis, y_axis = (
             edge_center_coordinates[edge.spawn_direction][0],
@@ -261,12 +676,7 @@ class HexMapVisualization(QGraphicsView):
             1.2  # This is the scale factor for the texture to fit the hex edge
         )
 
-        pixmap = QPixmap(f"assets/{asset}")
-        scale_pixmap = pixmap.scaled(
-            QSize(size * scale_factor, size * scale_factor),
-            Qt.KeepAspectRatio,
-            Qt.SmoothTransformation,
-        )
+        scale_pixmap = self._get_scaled_pixmap(asset, size, scale_factor)
 
         pixmap_item = QGraphicsPixmapItem(scale_pixmap)
         pixmap_item.setOffset(
@@ -280,9 +690,28 @@ class HexMapVisualization(QGraphicsView):
         pixmap_item.setRotation(rotation_matrix[edge.spawn_direction])
         pixmap_item.setPos(graphic_x_center, graphic_y_center)
 
-        # Draw the edge texture on screen
+        # Draw the edge texture on screen, grouped with all edges using the same texture
+
+        self._get_item_group(("edge", asset), Z_VALUE_EDGE_TEXTURE).addToGroup(
+            pixmap_item
+        )
+
+    def set_antialiasing(self, enabled):
+        """
+        Switch antialiasing of the map on or off.
 
-        self.scene.addItem(pixmap_item)
+        The static map layers are baked with the render hints in effect, so they are
+        drawn and cached again with the new hints.
+
+        :param enabled: True to enable antialiasing
+        """
+        self.setRenderHint(QPainter.Antialiasing, enabled)
+        self.setRenderHint(QPainter.SmoothPixmapTransform, enabled)
+
+        self.setUpdatesEnabled(False)
+        self.draw_static_layers(HEX_SIZE)
+        self.cache_static_layers()
+        self.setUpdatesEnabled(True)
 
     def update_info_label(self, q, r):
         self.parent_app.hex_info_label.setText(f"Hex Coordinates: {q},{r}")
@@ -317,3 +746,9 @@ class HexMapApp(QMainWindow):
         # Set the central widget and window title
         self.setCentralWidget(self.central_widget)
         self.setWindowTitle("Hex Map Visualization")
+
+        # Add a view menu to switch antialiasing of the map
+        self.view_menu = self.menuBar().addMenu("View")
+        self.antialiasing_action = self.view_menu.addAction("Antialiasing")
+        self.antialiasing_action.setCheckable(True)
+        self.antialiasing_action.toggled.connect(self.map_area_widget.set_antialiasing)